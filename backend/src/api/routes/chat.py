@@ -141,6 +141,7 @@ async def send_message(request: Request, chat_request: ChatRequest):
             qdrant_service=qdrant_service,
             embedding_service=embedding_service,
             llm_service=llm_service,
+            workflow=request.app.state.workflow,
         )
         
         result = await orchestrator.process_incident(
@@ -376,6 +377,7 @@ async def send_multimodal_message(
             qdrant_service=qdrant_service,
             embedding_service=embedding_service,
             llm_service=llm_service,
+            workflow=request.app.state.workflow,
         )
         
         # Generate incident ID for this session
@@ -228,6 +228,7 @@ async def create_multimodal_incident(
             qdrant_service=qdrant_service,
             embedding_service=embedding_service,
             llm_service=llm_service,
+            workflow=request.app.state.workflow,
         )
         
         # Run full workflow
@@ -5,9 +5,10 @@ Broadcasts events to all connected clients (Public, Dispatcher, Commander).
 """
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from typing import List, Dict, Any
-import json
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -53,7 +54,7 @@ async def broadcast(event: Dict[str, Any]):
         logger.debug("No WebSocket clients connected, skipping broadcast")
         return
     
-    message = json.dumps(event)
+    message = orjson.dumps(event).decode()
     disconnected = []
     
     for client in connected_clients:
@@ -69,6 +69,7 @@ class Orchestrator:
         embedding_service,
         llm_service,
         config: Optional[dict] = None,
+        workflow: Optional[AgentWorkflow] = None,
     ):
         """
         Initialize orchestrator with injected services.
@@ -78,6 +79,7 @@ class Orchestrator:
             embedding_service: EmbeddingService for embeddings
             llm_service: PortkeyLLMService for LLM calls
             config: Optional config override
+            workflow: Optional shared, prewarmed AgentWorkflow
         """
         self.qdrant = qdrant_service
         self.embedding = embedding_service
@@ -87,8 +89,8 @@ class Orchestrator:
         # Mode from settings
         self.mode = getattr(settings, 'AGENT_MODE', 'prod')
         
-        # Workflow instance (lazy init)
-        self._workflow = None
+        # Workflow instance (shared from app.state, or lazy init)
+        self._workflow = workflow
         
         # Idempotency tracking (in-memory for now, use Redis in production)
         self._processed_incidents: Dict[str, Dict] = {}
@@ -205,9 +207,9 @@ class Orchestrator:
         }
         
         try:
-            # Embed query (sync function - no await)
-            # embed_text returns List[List[float]], we need List[float]
-            query_embedding = self.embedding.embed_text(query)[0]
+            # Embed query, batched with other in-flight requests
+            # embed_text_async returns List[List[float]], we need List[float]
+            query_embedding = (await self.embedding.embed_text_async(query))[0]
             
             # Search incident memory (async - needs await)
             try:
@@ -6,6 +6,7 @@ This TypedDict defines the state that flows between all agents.
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
 from src.agents.schemas import (
+    AgentInput,
     ConfidenceBreakdown,
     GroundedClaim,
     AmbiguityFlag,
@@ -48,6 +49,7 @@ class IncidentState(TypedDict, total=False):
     # Supervisor
     intent: str
     initial_assessment: str
+    triage_from_supervisor: bool  # Triage node skipped via supervisor triage_hint
     
     # Triage
     priority: Literal["P1", "P2", "P3", "P4", "P5"]
@@ -73,11 +75,13 @@ class IncidentState(TypedDict, total=False):
     gaps_detected: List[str]
     grounding_issues: List[str]
     reflection_complete: bool
+    reflector_skipped: bool  # Protocol output was good enough to bypass reflection
     
     # ============ GROUNDING & CONFIDENCE ============
-    grounded_claims: List[Dict[str, Any]]  # Serialized GroundedClaim
+    # Claims/ambiguities hold model objects while running; serialized at HITL
+    grounded_claims: List[GroundedClaim | Dict[str, Any]]
     confidence: Dict[str, float]  # Serialized ConfidenceBreakdown
-    ambiguities: List[Dict[str, Any]]  # Serialized AmbiguityFlag
+    ambiguities: List[AmbiguityFlag | Dict[str, Any]]
     
     # ============ WORKFLOW CONTROL ============
     next_agent: Optional[str]
@@ -93,6 +97,10 @@ class IncidentState(TypedDict, total=False):
     total_processing_time_ms: int
     total_tokens_consumed: int
     errors: List[str]
+    
+    # ============ INTERNAL ============
+    _agent_input: Optional[AgentInput]  # Built once per run, refreshed per node
+    _counters: Dict[str, int]  # Running {time_ms, tokens}, published at HITL
 
 
 def create_initial_state(
@@ -2,12 +2,12 @@
 LangGraph Workflow - Agent orchestration graph
 
 Defines the agent workflow using LangGraph:
-- Supervisor → Triage/Geo/Vision
-- Triage → Protocol → Reflector
+- Supervisor → Triage/Geo/Vision (or straight to Protocol when it triaged confidently)
+- Triage → Protocol → Reflector (skipped when grounding is already sufficient)
 - Reflector → HITL or Loop Back
 """
 import logging
-from typing import Any, Dict, Literal
+from typing import Any, Dict, List, Literal, Optional
 
 from langgraph.graph import StateGraph, END
 
@@ -17,71 +17,148 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Nodes the reflector may loop back to
+_REFLECTOR_LOOPBACKS = frozenset({"supervisor", "triage", "geo"})
+
+# Intents where a confident supervisor triage hint replaces the triage node
+_FUSED_TRIAGE_INTENTS = frozenset({"medical", "fire", "accident", "crime"})
+_FUSED_TRIAGE_MIN_CONFIDENCE = 0.85
+_PRIORITIES = frozenset({"P1", "P2", "P3", "P4", "P5"})
+
+# Happy-path thresholds for skipping the reflector LLM call
+_SKIP_REFLECTOR_MIN_CLAIMS = 3
+_SKIP_REFLECTOR_QUALITY = 0.85
+
+# Supervisor intents with a dedicated next node; everything else goes to triage
+_INTENT_ROUTE = {
+    "location_unclear": "geo",
+    "visual_needed": "vision",
+}
+
 
 def build_agent_input(state: IncidentState) -> AgentInput:
     """Convert workflow state to AgentInput for agents."""
+    get = state.get
     return AgentInput(
-        incident_id=state.get("incident_id", ""),
-        query=state.get("query", ""),
-        channel=state.get("channel", "web"),
-        user_role=state.get("user_role", "dispatcher"),
-        text_input=state.get("text_input", ""),
-        audio_transcript=state.get("audio_transcript"),
-        image_embeddings=state.get("image_embeddings"),
-        location=state.get("location"),
-        retrieved_docs=state.get("retrieved_docs", []),
-        retrieved_images=state.get("retrieved_images", []),
-        retrieved_sops=state.get("retrieved_sops", []),
-        retrieved_landmarks=state.get("retrieved_landmarks", []),
-        agent_history=state.get("agent_history", []),
+        incident_id=get("incident_id", ""),
+        query=get("query", ""),
+        channel=get("channel", "web"),
+        user_role=get("user_role", "dispatcher"),
+        text_input=get("text_input", ""),
+        audio_transcript=get("audio_transcript"),
+        image_embeddings=get("image_embeddings"),
+        location=get("location"),
+        retrieved_docs=get("retrieved_docs", []),
+        retrieved_images=get("retrieved_images", []),
+        retrieved_sops=get("retrieved_sops", []),
+        retrieved_landmarks=get("retrieved_landmarks", []),
+        agent_history=get("agent_history", []),
         previous_outputs=_build_previous_outputs(state),
     )
 
 
+def get_counters(state: IncidentState) -> Dict[str, int]:
+    """
+    Return the run's usage counters, seeding them from the state's totals.
+    
+    run() sets them up front; nodes invoked outside run() get them lazily.
+    """
+    counters = state.get("_counters")
+    if counters is None:
+        counters = state["_counters"] = {
+            "time_ms": state.get("total_processing_time_ms", 0),
+            "tokens": state.get("total_tokens_consumed", 0),
+        }
+    return counters
+
+
+def refresh_agent_input(state: IncidentState) -> AgentInput:
+    """
+    Return the AgentInput for the next node.
+    
+    The input fields are fixed for a run, so the AgentInput built in run()
+    is reused and only the fields agents write to are refreshed.
+    """
+    agent_input = state.get("_agent_input")
+    if agent_input is None:
+        return build_agent_input(state)
+    return agent_input.model_copy(update={
+        "previous_outputs": _build_previous_outputs(state),
+        "agent_history": state.get("agent_history", []),
+    })
+
+
 def _build_previous_outputs(state: IncidentState) -> Dict[str, Any]:
     """Build previous_outputs dict from state for agent context."""
+    get = state.get
     outputs = {}
     
     # Supervisor outputs
-    if state.get("intent"):
+    if get("intent"):
         outputs["supervisor"] = {
-            "intent": state.get("intent"),
-            "initial_assessment": state.get("initial_assessment"),
+            "intent": get("intent"),
+            "initial_assessment": get("initial_assessment"),
         }
     
     # Triage outputs
-    if state.get("priority"):
+    if get("priority"):
         outputs["triage"] = {
-            "priority": state.get("priority"),
-            "incident_type": state.get("incident_type"),
-            "recommended_assets": state.get("recommended_assets", []),
+            "priority": get("priority"),
+            "incident_type": get("incident_type"),
+            "recommended_assets": get("recommended_assets", []),
         }
     
     # Geo outputs
-    if state.get("resolved_location"):
+    if get("resolved_location"):
         outputs["geo"] = {
-            "resolved_location": state.get("resolved_location"),
-            "address": state.get("address"),
-            "nearby_landmarks": state.get("nearby_landmarks", []),
+            "resolved_location": get("resolved_location"),
+            "address": get("address"),
+            "nearby_landmarks": get("nearby_landmarks", []),
         }
     
     # Protocol outputs
-    if state.get("recommended_sops"):
+    if get("recommended_sops"):
         outputs["protocol"] = {
-            "recommended_sops": state.get("recommended_sops"),
-            "critical_instructions": state.get("critical_instructions"),
+            "recommended_sops": get("recommended_sops"),
+            "critical_instructions": get("critical_instructions"),
         }
     
     # Vision outputs
-    if state.get("visual_analysis"):
+    if get("visual_analysis"):
         outputs["vision"] = {
-            "visual_analysis": state.get("visual_analysis"),
-            "visual_confirmation": state.get("visual_confirmation"),
+            "visual_analysis": get("visual_analysis"),
+            "visual_confirmation": get("visual_confirmation"),
         }
     
     return outputs
 
 
+def _parse_triage_hint(hint: Any) -> Optional[Dict[str, Any]]:
+    """
+    Validate the supervisor's raw triage hint.
+    
+    Returns the hint if it is confident enough and names a valid priority,
+    otherwise None so the normal triage node runs.
+    """
+    if not isinstance(hint, dict) or hint.get("priority") not in _PRIORITIES:
+        return None
+    try:
+        confidence = float(hint.get("confidence", 0))
+    except (TypeError, ValueError):
+        return None
+    if confidence < _FUSED_TRIAGE_MIN_CONFIDENCE:
+        return None
+    return hint
+
+
+def _dump_models(items: List[Any]) -> List[Dict[str, Any]]:
+    """Serialize Pydantic models to dicts, passing through existing dicts."""
+    return [
+        item.model_dump() if hasattr(item, "model_dump") else item
+        for item in items
+    ]
+
+
 class AgentWorkflow:
     """
     LangGraph workflow for emergency response agents.
@@ -92,6 +169,16 @@ class AgentWorkflow:
     With loop-back capability if Reflector detects gaps.
     """
     
+    # Log line emitted when each agent node starts
+    _BANNERS = {
+        "supervisor": "🎯 Running Supervisor Agent",
+        "triage": "🚨 Running Triage Agent",
+        "geo": "📍 Running Geo Agent",
+        "protocol": "📋 Running Protocol Agent",
+        "vision": "👁️ Running Vision Agent",
+        "reflector": "🔍 Running Reflector Agent",
+    }
+    
     def __init__(
         self,
         qdrant_service,
@@ -145,11 +232,16 @@ class AgentWorkflow:
                 raise ValueError(f"Unknown agent: {name}")
         return self._agents[name]
     
+    def _log_node(self, name: str) -> None:
+        """Log the node banner, skipping record creation when INFO is off."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self._BANNERS[name])
+    
     async def _run_supervisor(self, state: IncidentState) -> IncidentState:
         """Run supervisor agent node."""
-        logger.info("🎯 Running Supervisor Agent")
+        self._log_node("supervisor")
         agent = self._get_agent("supervisor")
-        agent_input = build_agent_input(state)
+        agent_input = refresh_agent_input(state)
         
         output = await agent.process(agent_input)
         
@@ -158,22 +250,33 @@ class AgentWorkflow:
         state["intent"] = result.get("intent", "unclear")
         state["initial_assessment"] = result.get("initial_assessment", "")
         state["next_agent"] = output.next_agent
-        state["agent_history"] = state.get("agent_history", []) + ["supervisor"]
+        state.setdefault("agent_history", []).append("supervisor")
         state["requires_human_approval"] = output.requires_human_approval
         state["requires_more_info"] = output.requires_more_info
-        state["total_processing_time_ms"] = state.get("total_processing_time_ms", 0) + output.processing_time_ms
-        state["total_tokens_consumed"] = state.get("total_tokens_consumed", 0) + output.tokens_consumed
+        counters = get_counters(state)
+        counters["time_ms"] += output.processing_time_ms
+        counters["tokens"] += output.tokens_consumed
+        
+        # Short, unambiguous reports: take triage from the supervisor's hint
+        triage_hint = None
+        if state["intent"] in _FUSED_TRIAGE_INTENTS:
+            triage_hint = _parse_triage_hint(result.get("triage_hint"))
+        state["triage_from_supervisor"] = triage_hint is not None
+        if triage_hint is not None:
+            state["priority"] = triage_hint["priority"]
+            state["incident_type"] = triage_hint.get("incident_type", "Unknown")
+            state["recommended_assets"] = triage_hint.get("recommended_assets", [])
         
         if output.ambiguities:
-            state["ambiguities"] = [a.model_dump() for a in output.ambiguities]
+            state["ambiguities"] = list(output.ambiguities)
         
         return state
     
     async def _run_triage(self, state: IncidentState) -> IncidentState:
         """Run triage agent node."""
-        logger.info("🚨 Running Triage Agent")
+        self._log_node("triage")
         agent = self._get_agent("triage")
-        agent_input = build_agent_input(state)
+        agent_input = refresh_agent_input(state)
         
         output = await agent.process(agent_input)
         
@@ -182,23 +285,23 @@ class AgentWorkflow:
         state["incident_type"] = result.get("incident_type", "Unknown")
         state["recommended_assets"] = result.get("recommended_assets", [])
         state["next_agent"] = output.next_agent
-        state["agent_history"] = state.get("agent_history", []) + ["triage"]
+        state.setdefault("agent_history", []).append("triage")
         state["requires_human_approval"] = output.requires_human_approval
-        state["total_processing_time_ms"] = state.get("total_processing_time_ms", 0) + output.processing_time_ms
-        state["total_tokens_consumed"] = state.get("total_tokens_consumed", 0) + output.tokens_consumed
+        counters = get_counters(state)
+        counters["time_ms"] += output.processing_time_ms
+        counters["tokens"] += output.tokens_consumed
         
         # Add grounded claims
         if output.grounded_claims:
-            existing = state.get("grounded_claims", [])
-            state["grounded_claims"] = existing + [c.model_dump() for c in output.grounded_claims]
+            state.setdefault("grounded_claims", []).extend(output.grounded_claims)
         
         return state
     
     async def _run_geo(self, state: IncidentState) -> IncidentState:
         """Run geo agent node."""
-        logger.info("📍 Running Geo Agent")
+        self._log_node("geo")
         agent = self._get_agent("geo")
-        agent_input = build_agent_input(state)
+        agent_input = refresh_agent_input(state)
         
         output = await agent.process(agent_input)
         
@@ -207,22 +310,22 @@ class AgentWorkflow:
         state["address"] = result.get("address")
         state["nearby_landmarks"] = result.get("nearby_landmarks", [])
         state["next_agent"] = output.next_agent
-        state["agent_history"] = state.get("agent_history", []) + ["geo"]
+        state.setdefault("agent_history", []).append("geo")
         state["requires_more_info"] = output.requires_more_info
-        state["total_processing_time_ms"] = state.get("total_processing_time_ms", 0) + output.processing_time_ms
-        state["total_tokens_consumed"] = state.get("total_tokens_consumed", 0) + output.tokens_consumed
+        counters = get_counters(state)
+        counters["time_ms"] += output.processing_time_ms
+        counters["tokens"] += output.tokens_consumed
         
         if output.ambiguities:
-            existing = state.get("ambiguities", [])
-            state["ambiguities"] = existing + [a.model_dump() for a in output.ambiguities]
+            state.setdefault("ambiguities", []).extend(output.ambiguities)
         
         return state
     
     async def _run_protocol(self, state: IncidentState) -> IncidentState:
         """Run protocol agent node."""
-        logger.info("📋 Running Protocol Agent")
+        self._log_node("protocol")
         agent = self._get_agent("protocol")
-        agent_input = build_agent_input(state)
+        agent_input = refresh_agent_input(state)
         
         output = await agent.process(agent_input)
         
@@ -231,21 +334,27 @@ class AgentWorkflow:
         state["critical_instructions"] = result.get("critical_instructions", "")
         state["contraindications"] = result.get("contraindications")
         state["next_agent"] = output.next_agent
-        state["agent_history"] = state.get("agent_history", []) + ["protocol"]
-        state["total_processing_time_ms"] = state.get("total_processing_time_ms", 0) + output.processing_time_ms
-        state["total_tokens_consumed"] = state.get("total_tokens_consumed", 0) + output.tokens_consumed
+        state.setdefault("agent_history", []).append("protocol")
+        counters = get_counters(state)
+        counters["time_ms"] += output.processing_time_ms
+        counters["tokens"] += output.tokens_consumed
         
         if output.grounded_claims:
-            existing = state.get("grounded_claims", [])
-            state["grounded_claims"] = existing + [c.model_dump() for c in output.grounded_claims]
+            state.setdefault("grounded_claims", []).extend(output.grounded_claims)
+        
+        # Well-grounded, unambiguous result: no need for reflection
+        state["reflector_skipped"] = self._should_skip_reflector(state)
+        if state["reflector_skipped"]:
+            logger.info("⏭️ Skipping Reflector - grounding already sufficient")
+            state["quality_score"] = _SKIP_REFLECTOR_QUALITY
         
         return state
     
     async def _run_vision(self, state: IncidentState) -> IncidentState:
         """Run vision agent node."""
-        logger.info("👁️ Running Vision Agent")
+        self._log_node("vision")
         agent = self._get_agent("vision")
-        agent_input = build_agent_input(state)
+        agent_input = refresh_agent_input(state)
         
         output = await agent.process(agent_input)
         
@@ -253,18 +362,19 @@ class AgentWorkflow:
         state["visual_analysis"] = result.get("image_analysis")
         state["visual_confirmation"] = result.get("visual_confirmation", False)
         state["next_agent"] = output.next_agent
-        state["agent_history"] = state.get("agent_history", []) + ["vision"]
+        state.setdefault("agent_history", []).append("vision")
         state["requires_more_info"] = output.requires_more_info
-        state["total_processing_time_ms"] = state.get("total_processing_time_ms", 0) + output.processing_time_ms
-        state["total_tokens_consumed"] = state.get("total_tokens_consumed", 0) + output.tokens_consumed
+        counters = get_counters(state)
+        counters["time_ms"] += output.processing_time_ms
+        counters["tokens"] += output.tokens_consumed
         
         return state
     
     async def _run_reflector(self, state: IncidentState) -> IncidentState:
         """Run reflector agent node."""
-        logger.info("🔍 Running Reflector Agent")
+        self._log_node("reflector")
         agent = self._get_agent("reflector")
-        agent_input = build_agent_input(state)
+        agent_input = refresh_agent_input(state)
         
         output = await agent.process(agent_input)
         
@@ -274,12 +384,13 @@ class AgentWorkflow:
         state["grounding_issues"] = result.get("grounding_issues", [])
         state["reflection_complete"] = True
         state["next_agent"] = output.next_agent
-        state["agent_history"] = state.get("agent_history", []) + ["reflector"]
+        state.setdefault("agent_history", []).append("reflector")
         state["requires_human_approval"] = output.requires_human_approval
         state["requires_more_info"] = output.requires_more_info
         state["loop_back_to"] = output.next_agent if output.requires_more_info else None
-        state["total_processing_time_ms"] = state.get("total_processing_time_ms", 0) + output.processing_time_ms
-        state["total_tokens_consumed"] = state.get("total_tokens_consumed", 0) + output.tokens_consumed
+        counters = get_counters(state)
+        counters["time_ms"] += output.processing_time_ms
+        counters["tokens"] += output.tokens_consumed
         
         return state
     
@@ -292,14 +403,12 @@ class AgentWorkflow:
         if intent == "unclear" or state.get("requires_human_approval"):
             return "hitl"
         
-        # Route based on intent
-        if intent == "location_unclear":
-            return "geo"
-        elif intent == "visual_needed":
-            return "vision"
-        else:
-            # medical, fire, accident, crime → triage
-            return "triage"
+        # Supervisor already triaged with high confidence
+        if state.get("triage_from_supervisor"):
+            return "protocol"
+        
+        # Route based on intent (medical, fire, accident, crime → triage)
+        return _INTENT_ROUTE.get(intent, "triage")
     
     def _route_after_geo(self, state: IncidentState) -> str:
         """Route after geo resolution."""
@@ -317,15 +426,29 @@ class AgentWorkflow:
         """Route after triage."""
         return "protocol"
     
+    def _should_skip_reflector(self, state: IncidentState) -> bool:
+        """Check whether upstream agents already produced a high-quality result."""
+        # Only on the first pass: after a loop-back, claims accumulate and the
+        # reflector's own quality_score must not be overwritten
+        return (
+            not state.get("reflection_complete")
+            and len(state.get("grounded_claims", [])) >= _SKIP_REFLECTOR_MIN_CLAIMS
+            and not state.get("ambiguities")
+            and not state.get("requires_more_info")
+        )
+    
     def _route_after_protocol(self, state: IncidentState) -> str:
         """Route after protocol."""
+        if state.get("reflector_skipped"):
+            return "hitl"
         return "reflector"
     
     def _route_after_reflector(self, state: IncidentState) -> str:
         """Route based on reflector's quality assessment."""
-        quality_score = state.get("quality_score", 0.7)
-        iteration_count = state.get("iteration_count", 0)
-        max_iterations = state.get("max_iterations", 5)
+        get = state.get
+        quality_score = get("quality_score", 0.7)
+        iteration_count = get("iteration_count", 0)
+        max_iterations = get("max_iterations", 5)
         
         # Prevent infinite loops
         if iteration_count >= max_iterations:
@@ -337,8 +460,8 @@ class AgentWorkflow:
             return "hitl"
         
         # Low quality → loop back
-        loop_back_to = state.get("loop_back_to")
-        if loop_back_to and loop_back_to in ["supervisor", "triage", "geo"]:
+        loop_back_to = get("loop_back_to")
+        if loop_back_to in _REFLECTOR_LOOPBACKS:
             state["iteration_count"] = iteration_count + 1
             return loop_back_to
         
@@ -352,28 +475,45 @@ class AgentWorkflow:
         Marks the workflow as requiring human approval.
         The actual approval happens outside this graph.
         """
+        get = state.get
         logger.info("⏸️ HITL Checkpoint - Awaiting Human Approval")
         
+        # Publish accumulated usage counters
+        counters = get_counters(state)
+        state["total_processing_time_ms"] = counters["time_ms"]
+        state["total_tokens_consumed"] = counters["tokens"]
+        
         # Build final recommendation
         state["final_recommendation"] = {
-            "incident_id": state.get("incident_id"),
-            "priority": state.get("priority", "P3"),
-            "incident_type": state.get("incident_type", "Unknown"),
-            "recommended_assets": state.get("recommended_assets", []),
-            "location": state.get("resolved_location"),
-            "address": state.get("address"),
-            "critical_instructions": state.get("critical_instructions", ""),
-            "recommended_sops": state.get("recommended_sops", []),
-            "quality_score": state.get("quality_score", 0.7),
-            "gaps_detected": state.get("gaps_detected", []),
-            "grounded_claims_count": len(state.get("grounded_claims", [])),
+            "incident_id": get("incident_id"),
+            "priority": get("priority", "P3"),
+            "incident_type": get("incident_type", "Unknown"),
+            "recommended_assets": get("recommended_assets", []),
+            "location": get("resolved_location"),
+            "address": get("address"),
+            "critical_instructions": get("critical_instructions", ""),
+            "recommended_sops": get("recommended_sops", []),
+            "quality_score": get("quality_score", 0.7),
+            "gaps_detected": get("gaps_detected", []),
+            "grounded_claims_count": len(get("grounded_claims", [])),
         }
         
+        # Serialize grounding objects once, at the output boundary
+        state["grounded_claims"] = _dump_models(get("grounded_claims", []))
+        state["ambiguities"] = _dump_models(get("ambiguities", []))
+        state["final_recommendation"]["ambiguities"] = state["ambiguities"]
+        
         state["processing_complete"] = True
         state["requires_human_approval"] = True
         
         return state
     
+    def prewarm(self) -> None:
+        """Create every agent and compile the graph ahead of the first request."""
+        for name in self._BANNERS:
+            self._get_agent(name)
+        self.build_graph()
+    
     def build_graph(self) -> StateGraph:
         """Build the LangGraph workflow."""
         if self._graph is not None:
@@ -400,6 +540,7 @@ class AgentWorkflow:
             self._route_after_supervisor,
             {
                 "triage": "triage",
+                "protocol": "protocol",
                 "geo": "geo",
                 "vision": "vision",
                 "hitl": "hitl",
@@ -425,7 +566,14 @@ class AgentWorkflow:
         )
         
         workflow.add_edge("triage", "protocol")
-        workflow.add_edge("protocol", "reflector")
+        workflow.add_conditional_edges(
+            "protocol",
+            self._route_after_protocol,
+            {
+                "reflector": "reflector",
+                "hitl": "hitl",
+            }
+        )
         
         workflow.add_conditional_edges(
             "reflector",
@@ -450,6 +598,11 @@ class AgentWorkflow:
         
         logger.info(f"🚀 Starting workflow for incident: {initial_state.get('incident_id')}")
         
+        # Build the invariant part of AgentInput once per run
+        initial_state["_agent_input"] = build_agent_input(initial_state)
+        initial_state.pop("_counters", None)
+        get_counters(initial_state)
+        
         # Run the graph
         final_state = await graph.ainvoke(initial_state)
         
@@ -1,9 +1,11 @@
 """
 ResQ AI Backend - FastAPI Application Entry Point
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.config import settings
 from src.api.routes import health, incidents, search, media, chat, dispatcher, commander, websocket
@@ -21,25 +23,31 @@ async def lifespan(app: FastAPI):
     from src.services.qdrant_service import QdrantService
     from src.services.llm_service import PortkeyLLMService
     from src.services.embedding_service import get_embedding_service
+    from src.services.batched_embedding_service import BatchedEmbeddingService
     from src.services.postgres_service import get_postgres_client
     
-    app.state.qdrant = QdrantService()
-    await app.state.qdrant.initialize()
+    def load_embedding_service():
+        service = get_embedding_service()
+        # Force model load
+        _ = service.embed_text("warmup")
+        return service
     
-    # Initialize PostgreSQL (runs migrations)
-    print("📊 Initializing PostgreSQL...")
-    await get_postgres_client()
+    # Qdrant, PostgreSQL and the embedding model are independent, so start
+    # them together. The model loads in a worker thread and is started first
+    # so it overlaps with the (partly blocking) Qdrant initialization.
+    print("📊 Initializing Qdrant, PostgreSQL and embedding model...")
+    app.state.qdrant = QdrantService()
+    async with asyncio.TaskGroup() as tg:
+        embedding_task = tg.create_task(asyncio.to_thread(load_embedding_service))
+        tg.create_task(app.state.qdrant.initialize())
+        tg.create_task(get_postgres_client())  # Runs migrations
     print("✅ PostgreSQL ready")
     
-    app.state.llm = PortkeyLLMService()
-    
-    # Initialize embedding service
-    print("📊 Pre-loading embedding model...")
-    app.state.embedding = get_embedding_service()
-    # Force model load
-    _ = app.state.embedding.embed_text("warmup")
+    app.state.embedding = BatchedEmbeddingService(embedding_task.result())
     print("✅ Embedding model loaded")
     
+    app.state.llm = PortkeyLLMService()
+    
     # Log LLM service status
     if app.state.llm._portkey_available:
         print(f"🚀 Portkey AI Gateway: CONNECTED")
@@ -47,6 +55,17 @@ async def lifespan(app: FastAPI):
     else:
         print(f"⚠️ Portkey: Not configured, using direct Groq API")
     
+    # Build the agent workflow once; requests share its agents and compiled graph
+    from src.graph.workflow import AgentWorkflow
+    app.state.workflow = AgentWorkflow(
+        qdrant_service=app.state.qdrant,
+        embedding_service=app.state.embedding,
+        llm_service=app.state.llm,
+        config={},
+    )
+    app.state.workflow.prewarm()
+    print("✅ Agent workflow ready")
+    
     # Load commanders from CSV
     from src.services.commander_service import load_commanders
     load_commanders()
@@ -56,6 +75,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("👋 Shutting down ResQ AI...")
+    await app.state.embedding.close()
+    
+    from src.utils.logging import shutdown_logging
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -63,6 +86,7 @@ app = FastAPI(
     description="Emergency Response Agentic RAG System",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware
@@ -70,8 +94,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:5173"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=600,  # Let browsers cache preflight responses for 10 minutes
 )
 
 # Include routers
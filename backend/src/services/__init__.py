@@ -1,6 +1,7 @@
 """Services package."""
 from src.services.qdrant_service import QdrantService
 from src.services.embedding_service import EmbeddingService, get_embedding_service
+from src.services.batched_embedding_service import BatchedEmbeddingService
 from src.services.llm_service import LLMService, get_llm_service
 from src.services.transcription_service import TranscriptionService, get_transcription_service
 
@@ -8,6 +9,7 @@ __all__ = [
     "QdrantService",
     "EmbeddingService",
     "get_embedding_service",
+    "BatchedEmbeddingService",
     "LLMService",
     "get_llm_service",
     "TranscriptionService",
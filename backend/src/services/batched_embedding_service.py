@@ -0,0 +1,120 @@
+"""
+Batched Embedding Service - Coalesces concurrent text embedding requests
+
+Text embeddings requested through `embed_text_async` within a short window
+are sent to the model as one batch, which is much faster than embedding
+them one at a time. Everything else is delegated to the wrapped service.
+"""
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedEmbeddingService:
+    """
+    Wraps an EmbeddingService and batches concurrent text embeddings.
+
+    Requests are collected for up to `window_ms` (or until `max_batch`
+    texts are pending) and embedded with a single model call in a worker
+    thread, so the event loop is never blocked by the model.
+    """
+
+    def __init__(self, underlying, window_ms: float = 5, max_batch: int = 32):
+        self._underlying = underlying
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def __getattr__(self, name):
+        # Sync embed_text, embed_image_from_bytes, etc. go straight through
+        return getattr(self._underlying, name)
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts with one model call."""
+        return self._underlying.embed_text(texts)
+
+    async def embed_text_async(self, text: str) -> List[List[float]]:
+        """
+        Embed a single text, batched with other concurrent requests.
+
+        Returns the same shape as embed_text: a one-element list of vectors.
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return [await future]
+
+    async def _run(self):
+        """Background task that drains the queue in batches."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        pending: List[Tuple[str, asyncio.Future]] = []
+
+        try:
+            while True:
+                pending = [await queue.get()]
+                deadline = loop.time() + self._window
+
+                while len(pending) < self._max_batch:
+                    if not queue.empty():
+                        pending.append(queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                texts = [text for text, _ in pending]
+                try:
+                    vectors = list(await asyncio.to_thread(self.embed_batch, texts))
+                except Exception as e:
+                    logger.error(f"Batched embedding of {len(texts)} texts failed: {e}")
+                    self._fail(pending, e)
+                    continue
+
+                if len(vectors) != len(texts):
+                    e = RuntimeError(f"Embedding model returned {len(vectors)} vectors for {len(texts)} texts")
+                    logger.error(str(e))
+                    self._fail(pending, e)
+                    continue
+
+                for (_, future), vector in zip(pending, vectors):
+                    if not future.done():
+                        future.set_result(vector)
+                pending = []
+        except asyncio.CancelledError:
+            # Don't leave the in-flight batch waiting forever
+            self._fail(pending, RuntimeError("Embedding service closed"))
+            raise
+
+    @staticmethod
+    def _fail(pending: List[Tuple[str, asyncio.Future]], exc: BaseException):
+        """Fail every still-waiting future in a batch."""
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def close(self):
+        """Stop the background batching task and fail any queued requests."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._queue is not None:
+            queued = []
+            while not self._queue.empty():
+                queued.append(self._queue.get_nowait())
+            self._fail(queued, RuntimeError("Embedding service closed"))
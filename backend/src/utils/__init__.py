@@ -1,6 +1,7 @@
 """Utils package."""
 from src.utils.logging import (
     setup_logging,
+    shutdown_logging,
     logger,
     info,
     success,
@@ -13,6 +14,7 @@ from src.utils.logging import (
 
 __all__ = [
     "setup_logging",
+    "shutdown_logging",
     "logger",
     "info",
     "success",
@@ -5,13 +5,16 @@ Provides detailed, colored logs with:
 - Timestamps with milliseconds
 - Log levels (INFO, SUCCESS, WARNING, ERROR, DB, EMBED, AGENT)
 - Indentation for nested operations
-- File + console output
+- File + console output, written from a background thread
 """
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 class ColoredFormatter(logging.Formatter):
@@ -30,34 +33,57 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Precompute "<color>[" and "] [LEVEL  ] " per level
+        self._level_prefix = {}
+        for levelname in self.COLORS:
+            if levelname != "RESET":
+                self._level_prefix[levelname] = self._build_prefix(levelname)
+    
+    def _build_prefix(self, levelname):
+        color = self.COLORS.get(levelname, self.COLORS["INFO"])
+        return color + "[", "] [" + levelname[:7].ljust(7) + "] "
+    
     def format(self, record):
-        # Add color based on level
-        color = self.COLORS.get(record.levelname, self.COLORS["INFO"])
-        reset = self.COLORS["RESET"]
-        
-        # Format timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        
-        # Get indent if set
-        indent = getattr(record, "indent", 0)
-        prefix = "  " * indent
+        prefix = self._level_prefix.get(record.levelname)
+        if prefix is None:
+            prefix = self._level_prefix[record.levelname] = self._build_prefix(record.levelname)
         
-        # Build message
-        levelname = record.levelname[:7].ljust(7)
-        formatted = f"{color}[{timestamp}] [{levelname}] {prefix}{record.getMessage()}{reset}"
+        # Format timestamp (HH:MM:SS.mmm) from the record's creation time
+        created = record.created
+        lt = time.localtime(created)
+        ms = int((created - int(created)) * 1000)
+        timestamp = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}.{ms:03d}"
         
-        return formatted
+        return "".join((
+            prefix[0], timestamp, prefix[1],
+            _indent(getattr(record, "indent", 0)),
+            record.getMessage(),
+            self.COLORS["RESET"],
+        ))
 
 
 class PlainFormatter(logging.Formatter):
     """Plain formatter for file output."""
     
     def format(self, record):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        indent = getattr(record, "indent", 0)
-        prefix = "  " * indent
-        levelname = record.levelname[:7].ljust(7)
-        return f"[{timestamp}] [{levelname}] {prefix}{record.getMessage()}"
+        created = record.created
+        ms = int((created - int(created)) * 1000)
+        timestamp = f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))}.{ms:03d}"
+        return "".join((
+            "[", timestamp, "] [", record.levelname[:7].ljust(7), "] ",
+            _indent(getattr(record, "indent", 0)),
+            record.getMessage(),
+        ))
+
+
+# Indent strings for the common nesting depths
+_INDENTS = tuple("  " * i for i in range(9))
+
+
+def _indent(level):
+    return _INDENTS[level] if 0 <= level < len(_INDENTS) else "  " * level
 
 
 # Add custom log levels
@@ -99,6 +125,9 @@ class AppLogger(logging.Logger):
 # Set custom logger class
 logging.setLoggerClass(AppLogger)
 
+# Background listeners that perform the actual handler I/O, keyed by logger name
+_listeners: Dict[str, QueueListener] = {}
+
 
 def setup_logging(
     name: str = "resq",
@@ -118,15 +147,19 @@ def setup_logging(
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
     
     # Clear existing handlers
     logger.handlers.clear()
+    previous = _listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
     
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(ColoredFormatter())
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (optional)
     if log_file:
@@ -134,28 +167,83 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(PlainFormatter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Log calls only enqueue; the listener thread formats and writes,
+    # so stdout/file I/O never blocks the event loop
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     
     return logger
 
 
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop all background log listeners.
+    
+    Each logger gets its console/file handlers back, so records logged
+    after shutdown are written directly instead of being dropped.
+    """
+    while _listeners:
+        name, listener = _listeners.popitem()
+        listener.stop()
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+
+
+atexit.register(shutdown_logging)
+
+
 # Default logger instance
 logger = setup_logging()
 
 
-# Convenience functions for module-level usage
-def info(msg, indent=0): logger.info_indent(msg, indent=indent)
-def success(msg, indent=0): logger.success(msg, indent=indent)
-def warning(msg, indent=0): logger.warning(msg, extra={"indent": indent})
-def error(msg, indent=0): logger.error(msg, extra={"indent": indent})
-def db(msg, indent=0): logger.db(msg, indent=indent)
-def embed(msg, indent=0): logger.embed(msg, indent=indent)
-def agent(msg, indent=0): logger.agent(msg, indent=indent)
+# Convenience functions for module-level usage.
+# Each checks the level first and logs directly, skipping the AppLogger wrapper.
+def info(msg, indent=0):
+    if logger.isEnabledFor(logging.INFO):
+        logger._log(logging.INFO, msg, (), extra={"indent": indent})
+
+
+def success(msg, indent=0):
+    if logger.isEnabledFor(SUCCESS):
+        logger._log(SUCCESS, msg, (), extra={"indent": indent})
+
+
+def warning(msg, indent=0):
+    if logger.isEnabledFor(logging.WARNING):
+        logger._log(logging.WARNING, msg, (), extra={"indent": indent})
+
+
+def error(msg, indent=0):
+    if logger.isEnabledFor(logging.ERROR):
+        logger._log(logging.ERROR, msg, (), extra={"indent": indent})
+
+
+def db(msg, indent=0):
+    if logger.isEnabledFor(DB):
+        logger._log(DB, msg, (), extra={"indent": indent})
+
+
+def embed(msg, indent=0):
+    if logger.isEnabledFor(EMBED):
+        logger._log(EMBED, msg, (), extra={"indent": indent})
+
+
+def agent(msg, indent=0):
+    if logger.isEnabledFor(AGENT):
+        logger._log(AGENT, msg, (), extra={"indent": indent})
 
 
 # Export
 __all__ = [
     "setup_logging",
+    "shutdown_logging",
     "logger",
     "info",
     "success",
@@ -10,67 +10,150 @@ This script:
 Run once before starting the application.
 """
 import os
-import json
-import subprocess
 import sys
+import functools
+import gzip
+import io
+import json
 from pathlib import Path
-from datetime import datetime
-import random
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+# ============ SERIALIZATION ============
+# orjson is much faster than stdlib json; fall back if it isn't installed.
+# Both return UTF-8 bytes so files are written in binary mode.
+try:
+    import orjson
+
+    def _dumps(obj, pretty: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+except ImportError:
+    def _dumps(obj, pretty: bool = True) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_raw(path: Path, data: bytes):
+    """Write bytes with raw os.write calls, bypassing buffered file objects."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_json_gz(path: Path, records: list):
+    """
+    Write records as compact gzipped JSON.
+    
+    Large lists are streamed through iterencode into a 1 MiB buffered
+    writer, bounding peak memory; small ones are encoded in one go.
+    """
+    if len(records) <= STREAM_THRESHOLD:
+        with gzip.open(path, "wb") as f:
+            f.write(_dumps(records, pretty=False))
+        return
+    
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with io.BufferedWriter(io.FileIO(fd, "w"), buffer_size=1 << 20) as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb") as f:
+            for chunk in json.JSONEncoder(separators=(",", ":")).iterencode(records):
+                f.write(chunk.encode("utf-8"))
+
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 OSM_REGION = "bangalore"
 
+# Record count above which JSON output is streamed rather than built in memory
+STREAM_THRESHOLD = 10_000
+
+# Generator outputs
+INCIDENTS_FILE = DATA_DIR / "synthetic" / "incidents.json"
+INCIDENTS_GZ_FILE = INCIDENTS_FILE.with_suffix(".json.gz")
+SOPS_DIR = DATA_DIR / "synthetic" / "sops"
+SOPS_MARKER_FILE = SOPS_DIR / ".generated"
+LANDMARKS_FILE = DATA_DIR / "osm" / "bangalore_landmarks.json"
+
+# Also write a plain incidents.json for inspection (off unless set to 1/true/yes/on)
+WRITE_PLAIN_INCIDENTS = (
+    os.environ.get("RESQ_PLAIN_INCIDENTS", "").strip().lower() in {"1", "true", "yes", "on"}
+)
+
+# Written after all steps succeed; lets warm runs exit immediately
+MANIFEST = DATA_DIR / ".setup_complete"
+
+# Directories already created by this process
+_ensured: set[Path] = set()
+
+
+def _ensure_dir(path: Path):
+    """Create a directory once per process, skipping repeat mkdir syscalls."""
+    if path not in _ensured:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured.add(path)
+        _ensured.update(path.parents)
+
+
 # ============ LOGGING ============
-class Logger:
-    """Simple colored logger for visibility."""
-    
-    COLORS = {
-        "INFO": "\033[94m",     # Blue
-        "SUCCESS": "\033[92m",  # Green
-        "WARNING": "\033[93m",  # Yellow
-        "ERROR": "\033[91m",    # Red
-        "RESET": "\033[0m",
-    }
-    
-    @staticmethod
-    def log(level: str, message: str):
-        color = Logger.COLORS.get(level, "")
-        reset = Logger.COLORS["RESET"]
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"{color}[{timestamp}] [{level}] {message}{reset}")
-    
-    @staticmethod
-    def info(msg): Logger.log("INFO", msg)
-    
-    @staticmethod
-    def success(msg): Logger.log("SUCCESS", msg)
+_RESET = "\033[0m"
+
+
+def _make_logger(level: str, color: str):
+    """Build a log function that writes one colored, timestamped line."""
+    prefix = f"{color}[{{}}] [{level}] "
+    suffix = _RESET + "\n"
     
-    @staticmethod
-    def warning(msg): Logger.log("WARNING", msg)
+    def emit(msg, _write=sys.stdout.write, _now=datetime.now):
+        _write(prefix.format(_now().strftime("%H:%M:%S")) + msg + suffix)
     
-    @staticmethod
-    def error(msg): Logger.log("ERROR", msg)
+    return emit
 
 
-log = Logger()
+info = _make_logger("INFO", "\033[94m")        # Blue
+success = _make_logger("SUCCESS", "\033[92m")  # Green
+warning = _make_logger("WARNING", "\033[93m")  # Yellow
+error = _make_logger("ERROR", "\033[91m")      # Red
 
 
+# Generators already completed (or skipped) in this process
+_completed: set[str] = set()
 
 
+def _skip_if_exists(*markers: Path, message: str):
+    """
+    Skip a generator when any of its marker/output files already exist.
+    
+    The outcome is cached per process, so repeat calls skip the checks.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if func.__name__ in _completed:
+                return True
+            if any(marker.exists() for marker in markers):
+                info(message)
+                _completed.add(func.__name__)
+                return True
+            result = func(*args, **kwargs)
+            if result:
+                _completed.add(func.__name__)
+            return result
+        return wrapper
+    return decorator
+
 
+@_skip_if_exists(INCIDENTS_GZ_FILE, INCIDENTS_FILE, message="✓ Synthetic incidents already exist. Skipping.")
 def generate_synthetic_incidents():
     """Generate synthetic incident data for testing."""
-    incidents_file = DATA_DIR / "synthetic" / "incidents.json"
-    
-    if incidents_file.exists():
-        log.info("✓ Synthetic incidents already exist. Skipping.")
-        return True
+    info("🔧 Generating synthetic incident data...")
     
-    log.info("🔧 Generating synthetic incident data...")
+    import random
     
-    incidents_dir = DATA_DIR / "synthetic"
-    incidents_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(INCIDENTS_FILE.parent)
     
     # Bangalore locations
     locations = [
@@ -95,55 +178,90 @@ def generate_synthetic_incidents():
         ("HazMat_GasLeak", "P2", ["HazMat_Team", "Fire_Truck"]),
     ]
     
-    incidents = []
-    for i in range(50):
-        loc = random.choice(locations)
-        inc_type, priority, assets = random.choice(incident_types)
-        
-        incident = {
+    status_choices = ("resolved", "resolved", "resolved", "active")
+    access_choices = ("dispatcher", "dispatcher", "commander")
+    
+    # Draw all categorical samples up front in bulk
+    count = 50
+    _choices = random.choices
+    base_time = datetime(2024, 1, 1)
+    
+    # (lat, lon) jitter for every incident, vectorized when numpy is available
+    try:
+        import numpy as np
+        jitter = np.random.default_rng().uniform(-0.01, 0.01, size=(count, 2)).tolist()
+    except ImportError:
+        _uniform = random.uniform
+        jitter = [(_uniform(-0.01, 0.01), _uniform(-0.01, 0.01)) for _ in range(count)]
+    
+    draws = zip(
+        # Indices into the fixed locations / incident_types tables
+        _choices(range(len(locations)), k=count),
+        _choices(range(len(incident_types)), k=count),
+        _choices(status_choices, k=count),
+        _choices(access_choices, k=count),
+        # Timestamps: random minutes within 2024
+        [
+            (base_time + timedelta(minutes=offset)).isoformat(timespec="seconds")
+            for offset in _choices(range(366 * 24 * 60), k=count)
+        ],
+        jitter,
+    )
+    
+    # One shared assets_dispatched list per asset combination.
+    # Shared across incidents, so treat them as read-only.
+    assets_cache = {
+        tuple(assets): [{"type": a, "quantity": 1} for a in assets]
+        for _, _, assets in incident_types
+    }
+    
+    def _build_incident(i, loc_idx, type_idx, status, access_level, timestamp, offset):
+        loc = locations[loc_idx]
+        inc_type, priority, assets = incident_types[type_idx]
+        return {
             "id": f"INC-{i+1:04d}",
             "type": inc_type,
             "priority": priority,
             "description": f"Emergency incident at {loc['name']} - {inc_type.replace('_', ' ')}",
             "location": {
                 "name": loc["name"],
-                "lat": loc["lat"] + random.uniform(-0.01, 0.01),
-                "lon": loc["lon"] + random.uniform(-0.01, 0.01),
+                "lat": loc["lat"] + offset[0],
+                "lon": loc["lon"] + offset[1],
             },
-            "assets_dispatched": [{"type": a, "quantity": 1} for a in assets],
-            "status": random.choice(["resolved", "resolved", "resolved", "active"]),
-            "timestamp": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}T{random.randint(0,23):02d}:{random.randint(0,59):02d}:00",
-            "access_level": random.choice(["dispatcher", "dispatcher", "commander"]),
+            "assets_dispatched": assets_cache[tuple(assets)],
+            "status": status,
+            "timestamp": timestamp,
+            "access_level": access_level,
         }
-        incidents.append(incident)
     
-    with open(incidents_file, "w") as f:
-        json.dump(incidents, f, indent=2)
+    incidents = [_build_incident(i, *draw) for i, draw in enumerate(draws)]
+    
+    # Compact, gzipped JSON; seed_qdrant.py reads either form
+    _write_json_gz(INCIDENTS_GZ_FILE, incidents)
+    
+    # Readable copy for debugging
+    if WRITE_PLAIN_INCIDENTS:
+        INCIDENTS_FILE.write_bytes(_dumps(incidents))
     
-    log.success(f"✅ Generated {len(incidents)} synthetic incidents → {incidents_file}")
+    success(f"✅ Generated {len(incidents)} synthetic incidents → {INCIDENTS_GZ_FILE}")
     return True
 
 
+@_skip_if_exists(SOPS_MARKER_FILE, message="✓ Synthetic SOPs already exist. Skipping.")
 def generate_synthetic_sops():
     """Generate synthetic SOP documents."""
-    sops_dir = DATA_DIR / "synthetic" / "sops"
-    marker_file = sops_dir / ".generated"
-    
-    if marker_file.exists():
-        log.info("✓ Synthetic SOPs already exist. Skipping.")
-        return True
-    
-    log.info("📝 Generating synthetic SOP documents...")
+    info("📝 Generating synthetic SOP documents...")
     
-    sops_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(SOPS_DIR)
     
+    # SOP bodies are bytes literals so they are written without re-encoding
     sops = [
         {
             "id": "SOP-MED-001",
             "title": "Cardiac Arrest Response Protocol",
             "category": "Medical",
             "access_level": "dispatcher",
-            "content": """
+            "content": b"""
 # Cardiac Arrest Response Protocol (SOP-MED-001)
 
 ## Immediate Actions
@@ -168,7 +286,7 @@ def generate_synthetic_sops():
             "title": "Residential Fire Response",
             "category": "Fire",
             "access_level": "dispatcher",
-            "content": """
+            "content": b"""
 # Residential Fire Response Protocol (SOP-FIRE-001)
 
 ## Immediate Actions
@@ -192,7 +310,7 @@ def generate_synthetic_sops():
             "title": "Vehicle Accident Response",
             "category": "Accident",
             "access_level": "dispatcher",
-            "content": """
+            "content": b"""
 # Vehicle Accident Response Protocol (SOP-ACC-001)
 
 ## Scene Assessment
@@ -215,34 +333,26 @@ def generate_synthetic_sops():
     ]
     
     for sop in sops:
-        filepath = sops_dir / f"{sop['id']}.md"
-        with open(filepath, "w") as f:
-            f.write(sop["content"])
-        log.info(f"   Created: {filepath.name}")
+        filepath = SOPS_DIR / f"{sop['id']}.md"
+        _write_raw(filepath, sop["content"])
+        info(f"   Created: {filepath.name}")
     
     # Save metadata
-    metadata_file = sops_dir / "metadata.json"
+    metadata_file = SOPS_DIR / "metadata.json"
     metadata = [{k: v for k, v in sop.items() if k != "content"} for sop in sops]
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+    _write_raw(metadata_file, _dumps(metadata))
     
-    marker_file.touch()
-    log.success(f"✅ Generated {len(sops)} SOP documents → {sops_dir}")
+    SOPS_MARKER_FILE.touch()
+    success(f"✅ Generated {len(sops)} SOP documents → {SOPS_DIR}")
     return True
 
 
+@_skip_if_exists(LANDMARKS_FILE, message="✓ Landmark data already exists. Skipping.")
 def generate_landmarks():
     """Generate sample Bangalore landmarks (simplified OSM data)."""
-    landmarks_file = DATA_DIR / "osm" / "bangalore_landmarks.json"
+    info("🗺️ Generating Bangalore landmark data...")
     
-    if landmarks_file.exists():
-        log.info("✓ Landmark data already exists. Skipping.")
-        return True
-    
-    log.info("🗺️ Generating Bangalore landmark data...")
-    
-    osm_dir = DATA_DIR / "osm"
-    osm_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(LANDMARKS_FILE.parent)
     
     # Sample landmarks (would normally come from OSM Overpass API)
     landmarks = [
@@ -260,10 +370,9 @@ def generate_landmarks():
         {"name": "Cubbon Park", "alt_names": ["Cubbon"], "type": "park", "lat": 12.9763, "lon": 77.5929},
     ]
     
-    with open(landmarks_file, "w") as f:
-        json.dump(landmarks, f, indent=2)
+    LANDMARKS_FILE.write_bytes(_dumps(landmarks))
     
-    log.success(f"✅ Generated {len(landmarks)} landmarks → {landmarks_file}")
+    success(f"✅ Generated {len(landmarks)} landmarks → {LANDMARKS_FILE}")
     return True
 
 
@@ -273,7 +382,12 @@ def main():
     print("  ResQ AI - Data Setup Script")
     print("=" * 60 + "\n")
     
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # Set FORCE_REGEN to ignore the manifest and re-run every step's checks
+    if MANIFEST.exists() and not os.environ.get("FORCE_REGEN"):
+        success("✓ All data present. Nothing to do.")
+        return
+    
+    _ensure_dir(DATA_DIR)
     
     steps = [
         ("Generate Synthetic Incidents", generate_synthetic_incidents),
@@ -281,19 +395,28 @@ def main():
         ("Generate Landmark Data", generate_landmarks),
     ]
     
-    for step_name, step_func in steps:
-        log.info(f"Step: {step_name}")
+    # Steps write disjoint files, so run them concurrently and
+    # report results afterwards in step order
+    info(f"Running {len(steps)} steps concurrently...")
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = [(step_name, executor.submit(step_func)) for step_name, step_func in steps]
+    print()
+    
+    for step_name, future in futures:
+        info(f"Step: {step_name}")
         try:
-            success = step_func()
-            if not success:
-                log.warning(f"⚠️ {step_name} completed with warnings. Continuing...")
+            ok = future.result()
+            if not ok:
+                warning(f"⚠️ {step_name} completed with warnings. Continuing...")
         except Exception as e:
-            log.error(f"❌ {step_name} failed: {e}")
+            error(f"❌ {step_name} failed: {e}")
             raise
         print()
     
+    MANIFEST.touch()
+    
     print("=" * 60)
-    log.success("🎉 Data setup complete!")
+    success("🎉 Data setup complete!")
     print("=" * 60)
     print(f"\nData directory: {DATA_DIR}")
     print("\nNext step: Run the seeding script to push data to Qdrant")
@@ -15,12 +15,29 @@ You don't need to re-run this script unless you change Qdrant clusters.
 """
 import os
 import sys
+import asyncio
+import gzip
 import json
+import hashlib
 import time
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator
+import numpy as np
 from dotenv import load_dotenv
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    PointStruct,
+    SparseVector,
+    SparseVectorParams,
+    VectorParams,
+)
 
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
@@ -29,11 +46,33 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 IMAGES_DIR = PROJECT_ROOT / "Disaster_Dataset"  # Disaster images in ResQ_AI/Disaster_Dataset/
+EMBED_CACHE_DIR = DATA_DIR / ".emb_cache"  # Dense text embeddings keyed by sha256(model + text)
+EMBED_BATCH_SIZE = 64  # Texts per ONNX inference call
+CLIP_BATCH_SIZE = 32  # Images per CLIP forward pass
+CLIP_DECODE_SIZE = 256  # Images are decoded/shrunk to this shorter side before CLIP's 224px crop
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+IMAGE_DECODE_WORKERS = 8  # Threads decoding images ahead of CLIP (PIL releases the GIL)
+UPSERT_BATCH_SIZE = 64  # Points per upsert request
+UPSERT_CONCURRENCY = 4  # Upsert requests in flight at once
+UPSERT_MAX_RETRIES = 3  # Retries per batch on transient upload errors
+PIPELINE_BATCH_SIZE = 256  # Records embedded per pipeline stage
+PIPELINE_DEPTH = 4  # Embedded batches buffered ahead of the uploader
+# Optional int8 ONNX export of CLIP's projected vision tower, used instead of PyTorch when present.
+# It must take "pixel_values" and return "image_embeds" of shape (N, 512), e.g.:
+#   model = CLIPVisionModelWithProjection.from_pretrained("openai/clip-vit-base-patch32", return_dict=False)
+#   torch.onnx.export(model, torch.zeros(1, 3, 224, 224), "vision_model.onnx",
+#                     input_names=["pixel_values"], output_names=["image_embeds", "last_hidden_state"],
+#                     dynamic_axes={"pixel_values": {0: "batch"}, "image_embeds": {0: "batch"}})
+#   onnxruntime.quantization.quantize_dynamic("vision_model.onnx", "clip_onnx_quant/vision_model.onnx")
+CLIP_ONNX_PATH = Path(os.getenv("CLIP_ONNX_PATH", PROJECT_ROOT / "clip_onnx_quant" / "vision_model.onnx"))
 
 load_dotenv(PROJECT_ROOT / ".env")
 
 
 # ============ LOGGING ============
+_LOG_VERBOSE = os.getenv("SEED_VERBOSE") == "1"  # Per-file / per-category detail
+
+
 class Logger:
     """Detailed logging with colors and timestamps."""
     
@@ -44,16 +83,14 @@ class Logger:
         "ERROR": "\033[91m",     # Red
         "DB": "\033[96m",        # Cyan (for database operations)
         "EMBED": "\033[95m",     # Magenta (for embeddings)
+        "DEBUG": "\033[90m",     # Grey (only with SEED_VERBOSE=1)
         "RESET": "\033[0m",
     }
     
     @staticmethod
     def log(level: str, message: str, indent: int = 0):
-        color = Logger.COLORS.get(level, "")
-        reset = Logger.COLORS["RESET"]
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        prefix = "  " * indent
-        print(f"{color}[{timestamp}] [{level:7}] {prefix}{message}{reset}")
+        sys.stdout.write(_PREFIXES[level].format(timestamp) + "  " * indent + message + _SUFFIX)
     
     @staticmethod
     def info(msg, indent=0): Logger.log("INFO", msg, indent)
@@ -72,15 +109,26 @@ class Logger:
     
     @staticmethod
     def embed(msg, indent=0): Logger.log("EMBED", msg, indent)
+    
+    @staticmethod
+    def debug(msg, indent=0):
+        if _LOG_VERBOSE:
+            Logger.log("DEBUG", msg, indent)
 
 
+# Color + level tag per level, built once; only the timestamp is filled in per line
+_PREFIXES = {
+    level: f"{color}[{{}}] [{level:7}] "
+    for level, color in Logger.COLORS.items()
+    if level != "RESET"
+}
+_SUFFIX = Logger.COLORS["RESET"] + "\n"
+
 log = Logger()
 
 
 def check_qdrant_connection():
     """Verify Qdrant Cloud connection."""
-    from qdrant_client import QdrantClient
-    
     url = os.getenv("QDRANT_URL", "")
     api_key = os.getenv("QDRANT_API_KEY", "")
     
@@ -107,6 +155,86 @@ def check_qdrant_connection():
         return None
 
 
+def create_async_client():
+    """
+    Create an async Qdrant client for concurrent upserts.
+    
+    Uses gRPC, which sends vectors as packed binary floats instead of JSON text.
+    """
+    return AsyncQdrantClient(
+        url=os.getenv("QDRANT_URL", ""),
+        api_key=os.getenv("QDRANT_API_KEY", ""),
+        prefer_grpc=True,
+        timeout=30,
+    )
+
+
+async def upsert_batched(aclient, collection: str, points: list):
+    """Upsert points in fixed-size batches with a few requests in flight at once."""
+    semaphore = asyncio.Semaphore(UPSERT_CONCURRENCY)
+    
+    async def upsert_batch(batch):
+        async with semaphore:
+            # Retry transient failures with a short backoff before giving up
+            for attempt in range(UPSERT_MAX_RETRIES + 1):
+                try:
+                    await aclient.upsert(collection_name=collection, points=batch)
+                    return
+                except Exception as e:
+                    if attempt == UPSERT_MAX_RETRIES:
+                        raise
+                    log.warning(f"  Upsert to {collection} failed ({e}), retrying...", indent=2)
+                    await asyncio.sleep(2 ** attempt)
+    
+    await asyncio.gather(*(
+        upsert_batch(points[i:i + UPSERT_BATCH_SIZE])
+        for i in range(0, len(points), UPSERT_BATCH_SIZE)
+    ))
+
+
+async def embed_and_upsert(aclient, collection: str, records: Iterable, embed_batch, to_points, batch_size: int) -> int:
+    """
+    Embed records on worker threads while earlier batches are being upserted.
+    
+    records may be any iterable, including a stream read lazily from disk.
+    embed_batch(chunk) runs in a thread and returns the chunk's embeddings;
+    to_points(offset, chunk, embeddings) turns them into points. The queue is
+    bounded, so only a few embedded batches are held in memory at a time.
+    Returns the number of points upserted.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+    executor = ThreadPoolExecutor(max_workers=2)
+    upserted = 0
+    
+    async def produce():
+        it = iter(records)
+        offset = 0
+        while chunk := list(islice(it, batch_size)):
+            await queue.put((offset, chunk, loop.run_in_executor(executor, embed_batch, chunk)))
+            offset += len(chunk)
+        await queue.put(None)
+    
+    async def consume():
+        nonlocal upserted
+        while (item := await queue.get()) is not None:
+            offset, chunk, future = item
+            points = to_points(offset, chunk, await future)
+            await upsert_batched(aclient, collection, points)
+            upserted += len(points)
+            log.embed(f"  [{upserted}] upserted to {collection}", indent=1)
+            sys.stdout.flush()
+    
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            tg.create_task(consume())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return upserted
+
+
 def delete_all_collections(client):
     """Delete all existing collections to free up Qdrant Cloud storage."""
     log.info("🗑️ Cleaning up existing collections (to avoid storage limits)...")
@@ -118,9 +246,12 @@ def delete_all_collections(client):
             log.info("  No existing collections to delete", indent=1)
             return
         
-        for collection in existing:
-            log.db(f"  Deleting: {collection.name}...", indent=1)
-            client.delete_collection(collection.name)
+        names = [collection.name for collection in existing]
+        log.db(f"  Deleting: {', '.join(names)}...", indent=1)
+        
+        # Independent requests, so send them all at once
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            list(executor.map(client.delete_collection, names))
         
         log.success(f"✅ Deleted {len(existing)} collections", indent=1)
     except Exception as e:
@@ -129,8 +260,6 @@ def delete_all_collections(client):
 
 def create_collections(client):
     """Create Qdrant collections if they don't exist."""
-    from qdrant_client.models import Distance, VectorParams, SparseVectorParams, BinaryQuantization, BinaryQuantizationConfig
-    
     collections_config = {
         "incident_memory": {"dense_dim": 768, "sparse": True, "quantization": True},
         "visual_evidence": {"dense_dim": 512, "sparse": False, "quantization": True},
@@ -141,11 +270,14 @@ def create_collections(client):
     
     existing = {c.name for c in client.get_collections().collections}
     
+    to_create = {}
     for name, config in collections_config.items():
         if name in existing:
             log.db(f"✓ Collection exists: {name}", indent=1)
-            continue
-        
+        else:
+            to_create[name] = config
+    
+    def create(name, config):
         log.db(f"Creating collection: {name}...", indent=1)
         
         vectors_config = {
@@ -169,6 +301,11 @@ def create_collections(client):
         
         log.success(f"✅ Created: {name} (dim={config['dense_dim']}, sparse={config.get('sparse', False)})", indent=2)
     
+    if to_create:
+        # Collections are independent, so create them concurrently
+        with ThreadPoolExecutor(max_workers=len(to_create)) as executor:
+            list(executor.map(create, to_create.keys(), to_create.values()))
+    
     return True
 
 
@@ -180,9 +317,7 @@ def load_text_embedding_model():
         from fastembed import TextEmbedding
         model = TextEmbedding("BAAI/bge-base-en-v1.5")
         
-        # Warm up with test embedding
-        test_emb = list(model.embed(["test"]))[0]
-        log.success(f"✅ FastEmbed loaded! Output dim: {len(test_emb)}")
+        log.success("✅ FastEmbed loaded! Output dim: 768")
         return model
     except Exception as e:
         log.error(f"❌ Failed to load FastEmbed: {e}")
@@ -197,17 +332,48 @@ def load_sparse_model():
         from fastembed import SparseTextEmbedding
         model = SparseTextEmbedding("prithivida/Splade_PP_en_v1")
         
-        # Warm up
-        test_sparse = list(model.embed(["test"]))[0]
-        log.success(f"✅ SPLADE loaded! Non-zero terms: {len(test_sparse.indices)}")
+        log.success("✅ SPLADE loaded!")
         return model
     except Exception as e:
         log.warning(f"⚠️ SPLADE not available: {e}")
         return None
 
 
+def load_clip_onnx_model():
+    """Load the quantized ONNX CLIP vision model, if it has been exported."""
+    if not CLIP_ONNX_PATH.exists():
+        return None, None
+    
+    log.embed(f"Loading ONNX CLIP model: {CLIP_ONNX_PATH}...")
+    
+    try:
+        import onnxruntime as ort
+        from transformers import CLIPProcessor
+        
+        session = ort.InferenceSession(str(CLIP_ONNX_PATH), providers=["CPUExecutionProvider"])
+        
+        # Only a projected vision tower yields embeddings matching the PyTorch path
+        if "image_embeds" not in {o.name for o in session.get_outputs()}:
+            raise ValueError("model has no 'image_embeds' output (export CLIPVisionModelWithProjection)")
+        probe = session.run(["image_embeds"], {"pixel_values": np.zeros((1, 3, 224, 224), dtype=np.float32)})[0]
+        if probe.shape != (1, 512):
+            raise ValueError(f"'image_embeds' has shape {probe.shape}, expected (N, 512)")
+        
+        processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
+        
+        log.success("✅ ONNX CLIP loaded! Output dim: 512")
+        return session, processor
+    except Exception as e:
+        log.warning(f"⚠️ ONNX CLIP not available, falling back to PyTorch: {e}")
+        return None, None
+
+
 def load_clip_model():
-    """Load CLIP model for image embeddings."""
+    """Load CLIP model for image embeddings (ONNX Runtime if exported, else PyTorch)."""
+    session, processor = load_clip_onnx_model()
+    if session is not None:
+        return session, processor
+    
     log.embed("Loading CLIP model: openai/clip-vit-base-patch32...")
     
     try:
@@ -217,82 +383,242 @@ def load_clip_model():
         model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
         processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
         
-        log.success(f"✅ CLIP loaded! Output dim: 512")
+        model = model.eval()
+        if torch.cuda.is_available():
+            # fp16 halves memory traffic; compile fuses the vision tower kernels.
+            # Default mode, not "reduce-overhead": CUDA graphs are unsafe with the
+            # pipeline's concurrent embed threads and re-record for the last partial batch.
+            model = model.to("cuda").half()
+            if hasattr(torch, "compile"):
+                model.get_image_features = torch.compile(model.get_image_features)
+        
+        log.success(f"✅ CLIP loaded on {model.device}! Output dim: 512")
         return model, processor
     except Exception as e:
         log.warning(f"⚠️ CLIP not available: {e}")
         return None, None
 
 
-def seed_incidents(client, text_model, sparse_model):
-    """Seed incident_memory collection."""
-    from qdrant_client.models import PointStruct, SparseVector
+def load_image(path: Path):
+    """
+    Decode an image at roughly the resolution CLIP needs.
     
-    incidents_file = DATA_DIR / "synthetic" / "incidents.json"
+    JPEGs are decoded at a reduced DCT scale by libjpeg, and anything still
+    larger is shrunk so its shorter side is CLIP_DECODE_SIZE, leaving the
+    processor only a small resize and crop.
+    """
+    from PIL import Image
+    
+    image = Image.open(path)
+    if image.format == "JPEG":
+        image.draft("RGB", (CLIP_DECODE_SIZE, CLIP_DECODE_SIZE))
+    image = image.convert("RGB")
+    
+    scale = CLIP_DECODE_SIZE / min(image.size)
+    if scale < 1:
+        image = image.resize((round(image.width * scale), round(image.height * scale)), Image.BILINEAR)
+    return image
+
+
+# The pipeline embeds on two threads; the (possibly torch.compile'd) PyTorch
+# CLIP model is shared, so its forward passes run one at a time
+_clip_lock = threading.Lock()
+
+
+def embed_image_batch(clip_model, clip_processor, images):
+    """Embed a batch of PIL images, returning L2-normalized float32 rows."""
+    if not hasattr(clip_model, "get_image_features"):
+        # onnxruntime.InferenceSession
+        pixel_values = clip_processor(images=images, return_tensors="np")["pixel_values"]
+        features = clip_model.run(["image_embeds"], {"pixel_values": pixel_values.astype(np.float32)})[0]
+        features = features.astype(np.float32)
+        return features / np.linalg.norm(features, axis=-1, keepdims=True)
     
-    if not incidents_file.exists():
-        log.warning(f"⚠️ No incidents file found at {incidents_file}")
+    import torch
+    
+    device = clip_model.device
+    inputs = clip_processor(images=images, return_tensors="pt").to(device)
+    inputs = {k: v.to(clip_model.dtype) if v.is_floating_point() else v for k, v in inputs.items()}
+    
+    with _clip_lock, torch.inference_mode(), torch.autocast(device.type, dtype=torch.float16, enabled=device.type == "cuda"):
+        features = clip_model.get_image_features(**inputs)
+    features = torch.nn.functional.normalize(features.float(), p=2, dim=-1)
+    return features.cpu().numpy()
+
+
+def embed_texts_batched(model, texts: List[str]):
+    """
+    Embed texts in batches, returning the model's generator of embeddings.
+    
+    Runs in-process: the pipeline already embeds chunks on worker threads,
+    and the ONNX session parallelizes each batch with its own thread pool.
+    """
+    return model.embed(texts, batch_size=EMBED_BATCH_SIZE)
+
+
+def iter_json_array(path: Path, opener=open) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the items of a top-level JSON array.
+    
+    Streams with ijson when it is installed so large files never sit in
+    memory whole; otherwise falls back to json.load.
+    """
+    with opener(path, "rb") as f:
+        try:
+            import ijson
+        except ImportError:
+            yield from json.load(f)
+            return
+        yield from ijson.items(f, "item", use_float=True)
+
+
+def get_or_embed(model, texts: List[str], cache_dir: Path = EMBED_CACHE_DIR) -> np.ndarray:
+    """
+    Dense-embed texts, reusing embeddings cached on disk by a previous run.
+    
+    Each embedding is stored as {sha256(model name + text)}.npy, so unchanged
+    texts are never re-embedded on reseed. Returns rows in the order of texts.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    model_name = getattr(model, "model_name", "")
+    paths = [
+        cache_dir / f"{hashlib.sha256((model_name + chr(0) + text).encode()).hexdigest()}.npy"
+        for text in texts
+    ]
+    
+    embeddings = [None] * len(texts)
+    missing = []
+    for i, path in enumerate(paths):
+        try:
+            embeddings[i] = np.load(path)
+        except (OSError, ValueError):
+            missing.append(i)
+    
+    if missing:
+        for i, embedding in zip(missing, embed_texts_batched(model, [texts[i] for i in missing])):
+            embeddings[i] = embedding
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = paths[i].with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, embedding)
+            os.replace(tmp_path, paths[i])
+    
+    return np.stack(embeddings)
+
+
+def embed_sparse(model, texts: List[str]) -> list:
+    """
+    SPLADE-embed texts straight into SparseVectors (all None without SPLADE).
+    
+    Called from the pipeline's embed stage, so the array-to-list conversion
+    happens on a worker thread rather than in the upload loop. Arrays are
+    converted with a bulk .tolist(): the client would accept numpy arrays,
+    but coerces them element by element, which is slower.
+    """
+    if model is None:
+        return [None] * len(texts)
+    return [
+        SparseVector(indices=emb.indices.tolist(), values=emb.values.tolist())
+        for emb in embed_texts_batched(model, texts)
+    ]
+
+
+async def seed_incidents(aclient, text_model, sparse_model):
+    """Seed incident_memory collection."""
+    incidents_file = DATA_DIR / "synthetic" / "incidents.json"
+    incidents_gz_file = incidents_file.with_suffix(".json.gz")
+    
+    if incidents_gz_file.exists():
+        incidents = iter_json_array(incidents_gz_file, opener=gzip.open)
+    elif incidents_file.exists():
+        incidents = iter_json_array(incidents_file)
+    else:
+        log.warning(f"⚠️ No incidents file found at {incidents_gz_file} or {incidents_file}")
         log.info("Run download_data.py first to generate synthetic data", indent=1)
         return 0
     
-    with open(incidents_file) as f:
-        incidents = json.load(f)
+    log.db("Seeding incidents to incident_memory...")
     
-    log.db(f"Seeding {len(incidents)} incidents to incident_memory...")
+    def embed_batch(chunk):
+        texts = [
+            f"{incident['description']} {incident['type']} {incident['location']['name']}"
+            for incident in chunk
+        ]
+        dense = get_or_embed(text_model, texts)
+        return list(zip(dense, embed_sparse(sparse_model, texts)))
     
-    points = []
-    for i, incident in enumerate(incidents):
-        # Generate embedding
-        text = f"{incident['description']} {incident['type']} {incident['location']['name']}"
-        
-        log.embed(f"  [{i+1}/{len(incidents)}] Embedding: {text[:50]}...", indent=1)
-        
-        dense_emb = list(text_model.embed([text]))[0].tolist()
-        
-        vectors = {"dense": dense_emb}
-        
-        if sparse_model:
-            sparse_emb = list(sparse_model.embed([text]))[0]
-            vectors["sparse"] = SparseVector(
-                indices=sparse_emb.indices.tolist(),
-                values=sparse_emb.values.tolist(),
+    def to_points(offset, chunk, embeddings):
+        points = []
+        for i, (incident, (dense_emb, sparse_vec)) in enumerate(zip(chunk, embeddings), offset):
+            vectors = {"dense": dense_emb.tolist()}
+            
+            if sparse_vec is not None:
+                vectors["sparse"] = sparse_vec
+            
+            point = PointStruct(
+                id=i,
+                vector=vectors,
+                payload={
+                    "incident_id": incident["id"],
+                    "type": incident["type"],
+                    "priority": incident["priority"],
+                    "description": incident["description"],
+                    "location": incident["location"],
+                    "status": incident["status"],
+                    "access_level": incident["access_level"],
+                }
             )
-        
-        point = PointStruct(
-            id=i,
-            vector=vectors,
-            payload={
-                "incident_id": incident["id"],
-                "type": incident["type"],
-                "priority": incident["priority"],
-                "description": incident["description"],
-                "location": incident["location"],
-                "status": incident["status"],
-                "access_level": incident["access_level"],
-            }
-        )
-        points.append(point)
+            points.append(point)
+        return points
     
-    # Batch upsert
-    log.db(f"  Upserting {len(points)} points to Qdrant...", indent=1)
+    # Records stream from disk; embedding of later batches overlaps with upserting earlier ones
+    log.embed(f"  Embedding and upserting incidents (batch size {EMBED_BATCH_SIZE})...", indent=1)
     
     start = time.time()
-    client.upsert(collection_name="incident_memory", points=points)
+    count = await embed_and_upsert(aclient, "incident_memory", incidents, embed_batch, to_points, PIPELINE_BATCH_SIZE)
     elapsed = time.time() - start
     
-    log.success(f"✅ Upserted {len(points)} incidents in {elapsed:.2f}s", indent=1)
+    log.success(f"✅ Upserted {count} incidents in {elapsed:.2f}s", indent=1)
+    
+    return count
+
+
+def _sop_to_text(sop: Dict[str, Any]) -> str:
+    """Build the searchable text embedded for an SOP."""
+    text_parts = [sop.get("title", ""), sop.get("category", ""), sop.get("subcategory", "")]
+    
+    # Add keywords
+    text_parts.extend(sop.get("keywords", []))
     
-    # Verify
-    info = client.get_collection("incident_memory")
-    log.db(f"  Collection now has {info.points_count} points", indent=1)
+    # Add step summaries
+    for step in sop.get("response_protocol_steps", []):
+        if isinstance(step, dict):
+            text_parts.append(step.get("phase", ""))
+            text_parts.append(step.get("action", ""))
     
-    return len(points)
+    # If it's a reference doc, use content directly
+    if "content" in sop:
+        text_parts.append(sop["content"][:1000])
+    
+    return " ".join(filter(None, text_parts))[:2000]
+
+
+def _sop_to_payload(sop: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the stored payload for an SOP."""
+    return {
+        "sop_id": sop["sop_id"],
+        "title": sop.get("title", ""),
+        "category": sop.get("category", ""),
+        "subcategory": sop.get("subcategory", ""),
+        "keywords": sop.get("keywords", []),
+        "required_assets": sop.get("required_assets", {}),
+        "escalation_triggers": sop.get("escalation_triggers", []),
+        "source_file": sop.get("source_file", ""),
+    }
 
 
-def seed_sops(client, text_model):
+async def seed_sops(aclient, text_model):
     """Seed protocols_sops collection from JSON SOP files."""
-    from qdrant_client.models import PointStruct
-    
     sops_dir = DATA_DIR / "synthetic" / "sops"
     
     # Find all JSON SOP files (new format)
@@ -304,11 +630,16 @@ def seed_sops(client, text_model):
     
     log.db(f"Found {len(json_files)} SOP JSON files")
     
-    all_sops = []
+    # Embedding text and payload are built as each SOP is parsed
+    texts, payloads = [], []
+    
+    def add(sop):
+        texts.append(_sop_to_text(sop))
+        payloads.append(_sop_to_payload(sop))
     
     # Parse each JSON file
     for json_file in json_files:
-        log.info(f"  Reading: {json_file.name}", indent=1)
+        log.debug(f"  Reading: {json_file.name}", indent=1)
         with open(json_file) as f:
             data = json.load(f)
         
@@ -317,23 +648,21 @@ def seed_sops(client, text_model):
         for key in data:
             if key.endswith("_sops") and isinstance(data[key], list):
                 for sop in data[key]:
-                    all_sops.append({
-                        "sop_id": sop.get("sop_id", f"SOP-{len(all_sops)+1:03d}"),
+                    add({
+                        "sop_id": sop.get("sop_id", f"SOP-{len(payloads)+1:03d}"),
                         "title": sop.get("title", "Unknown SOP"),
                         "category": sop.get("category", key.replace("_sops", "").replace("_", " ").title()),
                         "subcategory": sop.get("subcategory", ""),
                         "keywords": sop.get("keywords", []),
-                        "priority_determination": sop.get("priority_determination", {}),
                         "required_assets": sop.get("required_assets", {}),
                         "response_protocol_steps": sop.get("response_protocol_steps", []),
                         "escalation_triggers": sop.get("escalation_triggers", []),
-                        "india_specific_considerations": sop.get("india_specific_considerations", []),
                         "source_file": json_file.name,
                     })
         
         # Also include priority_classification and system_metadata as reference docs
         if "priority_classification" in data:
-            all_sops.append({
+            add({
                 "sop_id": "SOP-PRIORITY-001",
                 "title": "Priority Classification Guidelines",
                 "category": "Reference",
@@ -342,7 +671,7 @@ def seed_sops(client, text_model):
             })
         
         if "system_metadata" in data:
-            all_sops.append({
+            add({
                 "sop_id": "SOP-META-001",
                 "title": "Emergency Response System Metadata",
                 "category": "Reference",
@@ -350,122 +679,84 @@ def seed_sops(client, text_model):
                 "source_file": json_file.name,
             })
     
-    log.db(f"Seeding {len(all_sops)} SOPs to protocols_sops...")
+    log.db(f"Seeding {len(payloads)} SOPs to protocols_sops...")
     
-    points = []
-    for i, sop in enumerate(all_sops):
-        # Build searchable text from SOP content
-        text_parts = [sop.get("title", ""), sop.get("category", ""), sop.get("subcategory", "")]
-        
-        # Add keywords
-        text_parts.extend(sop.get("keywords", []))
-        
-        # Add step summaries
-        for step in sop.get("response_protocol_steps", []):
-            if isinstance(step, dict):
-                text_parts.append(step.get("phase", ""))
-                text_parts.append(step.get("action", ""))
-        
-        # If it's a reference doc, use content directly
-        if "content" in sop:
-            text_parts.append(sop["content"][:1000])
-        
-        embed_text = " ".join(filter(None, text_parts))[:2000]
-        
-        log.embed(f"  [{i+1}/{len(all_sops)}] Embedding SOP: {sop.get('sop_id', 'Unknown')}", indent=1)
-        
-        dense_emb = list(text_model.embed([embed_text]))[0].tolist()
-        
-        point = PointStruct(
-            id=i,
-            vector={"dense": dense_emb},
-            payload={
-                "sop_id": sop.get("sop_id", f"SOP-{i:03d}"),
-                "title": sop.get("title", ""),
-                "category": sop.get("category", ""),
-                "subcategory": sop.get("subcategory", ""),
-                "keywords": sop.get("keywords", []),
-                "required_assets": sop.get("required_assets", {}),
-                "escalation_triggers": sop.get("escalation_triggers", []),
-                "source_file": sop.get("source_file", ""),
-            }
-        )
-        points.append(point)
+    def embed_batch(chunk):
+        return get_or_embed(text_model, [text for text, _ in chunk])
     
-    log.db(f"  Upserting {len(points)} SOPs to Qdrant...", indent=1)
+    def to_points(offset, chunk, embeddings):
+        return [
+            PointStruct(id=i, vector={"dense": dense_emb.tolist()}, payload=payload)
+            for i, ((_, payload), dense_emb) in enumerate(zip(chunk, embeddings), offset)
+        ]
+    
+    log.embed(f"  Embedding and upserting {len(payloads)} SOPs (batch size {EMBED_BATCH_SIZE})...", indent=1)
     
     start = time.time()
-    client.upsert(collection_name="protocols_sops", points=points)
+    count = await embed_and_upsert(
+        aclient, "protocols_sops", list(zip(texts, payloads)), embed_batch, to_points, PIPELINE_BATCH_SIZE
+    )
     elapsed = time.time() - start
     
-    log.success(f"✅ Upserted {len(points)} SOPs in {elapsed:.2f}s", indent=1)
+    log.success(f"✅ Upserted {count} SOPs in {elapsed:.2f}s", indent=1)
     
-    return len(points)
+    return count
 
 
-def seed_landmarks(client, text_model, sparse_model):
+async def seed_landmarks(aclient, text_model, sparse_model):
     """Seed landmark_index collection."""
-    from qdrant_client.models import PointStruct, SparseVector
-    
     landmarks_file = DATA_DIR / "osm" / "bangalore_landmarks.json"
     
     if not landmarks_file.exists():
         log.warning(f"⚠️ No landmarks file found at {landmarks_file}")
         return 0
     
-    with open(landmarks_file) as f:
-        landmarks = json.load(f)
+    log.db("Seeding landmarks to landmark_index...")
     
-    log.db(f"Seeding {len(landmarks)} landmarks to landmark_index...")
-    
-    points = []
-    for i, landmark in enumerate(landmarks):
+    def embed_batch(chunk):
         # Combine name and alt names for better matching
-        text = f"{landmark['name']} {' '.join(landmark.get('alt_names', []))}"
-        
-        log.embed(f"  [{i+1}/{len(landmarks)}] Embedding: {landmark['name']}", indent=1)
-        
-        dense_emb = list(text_model.embed([text]))[0].tolist()
-        
-        vectors = {"dense": dense_emb}
-        
-        if sparse_model:
-            sparse_emb = list(sparse_model.embed([text]))[0]
-            vectors["sparse"] = SparseVector(
-                indices=sparse_emb.indices.tolist(),
-                values=sparse_emb.values.tolist(),
+        join = " ".join
+        texts = [f"{landmark['name']} {join(landmark.get('alt_names', ()))}" for landmark in chunk]
+        dense = get_or_embed(text_model, texts)
+        return list(zip(dense, embed_sparse(sparse_model, texts)))
+    
+    def to_points(offset, chunk, embeddings):
+        points = []
+        for i, (landmark, (dense_emb, sparse_vec)) in enumerate(zip(chunk, embeddings), offset):
+            vectors = {"dense": dense_emb.tolist()}
+            
+            if sparse_vec is not None:
+                vectors["sparse"] = sparse_vec
+            
+            point = PointStruct(
+                id=i,
+                vector=vectors,
+                payload={
+                    "name": landmark["name"],
+                    "alt_names": landmark.get("alt_names", []),
+                    "type": landmark["type"],
+                    "lat": landmark["lat"],
+                    "lon": landmark["lon"],
+                }
             )
-        
-        point = PointStruct(
-            id=i,
-            vector=vectors,
-            payload={
-                "name": landmark["name"],
-                "alt_names": landmark.get("alt_names", []),
-                "type": landmark["type"],
-                "lat": landmark["lat"],
-                "lon": landmark["lon"],
-            }
-        )
-        points.append(point)
+            points.append(point)
+        return points
     
-    log.db(f"  Upserting {len(points)} landmarks to Qdrant...", indent=1)
+    log.embed(f"  Embedding and upserting landmarks (batch size {EMBED_BATCH_SIZE})...", indent=1)
     
     start = time.time()
-    client.upsert(collection_name="landmark_index", points=points)
+    count = await embed_and_upsert(
+        aclient, "landmark_index", iter_json_array(landmarks_file), embed_batch, to_points, PIPELINE_BATCH_SIZE
+    )
     elapsed = time.time() - start
     
-    log.success(f"✅ Upserted {len(points)} landmarks in {elapsed:.2f}s", indent=1)
+    log.success(f"✅ Upserted {count} landmarks in {elapsed:.2f}s", indent=1)
     
-    return len(points)
+    return count
 
 
-def seed_images(client, clip_model, clip_processor):
+async def seed_images(aclient, clip_model, clip_processor):
     """Seed visual_evidence collection with disaster images."""
-    from qdrant_client.models import PointStruct
-    from PIL import Image
-    import torch
-    
     if clip_model is None:
         log.warning("⚠️ CLIP model not loaded, skipping image seeding")
         return 0
@@ -482,11 +773,14 @@ def seed_images(client, clip_model, clip_processor):
     log.info(f"Found {len(categories)} categories in Disaster_Dataset")
     
     for category_dir in categories:
-        category_images = []
-        for ext in {".jpg", ".jpeg", ".png", ".webp"}:
-            # Use recursive glob to find images in subfolders too (e.g., Fire_Disaster/Urban_Fire/*.png)
-            category_images.extend(list(category_dir.glob(f"**/*{ext}")))
-            
+        # Single recursive walk to find images in subfolders too (e.g., Fire_Disaster/Urban_Fire/*.png)
+        category_images = [
+            Path(root) / filename
+            for root, _, files in os.walk(category_dir)
+            for filename in files
+            if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS
+        ]
+        
         # Sort to ensure deterministic selection
         category_images.sort()
         
@@ -494,7 +788,7 @@ def seed_images(client, clip_model, clip_processor):
         selected = category_images[:20]
         # Store tuple of (image_path, category_name) to preserve top-level folder name
         images_to_process.extend([(img, category_dir.name) for img in selected])
-        log.db(f"  Category '{category_dir.name}': found {len(category_images)}, selected {len(selected)}", indent=1)
+        log.debug(f"  Category '{category_dir.name}': found {len(category_images)}, selected {len(selected)}", indent=1)
 
     if not images_to_process:
         log.warning(f"⚠️ No images found in {IMAGES_DIR}")
@@ -502,23 +796,40 @@ def seed_images(client, clip_model, clip_processor):
         
     log.db(f"Seeding total {len(images_to_process)} images to visual_evidence...")
     
-    points = []
     failed = 0
     
-    for i, (img_path, category) in enumerate(images_to_process):
+    def load(record):
+        _, (img_path, _) = record
         try:
-            log.embed(f"  [{i+1}/{len(images_to_process)}] Processing: {img_path.name} ({category})", indent=1)
-            
-            # Load and embed image
-            image = Image.open(img_path).convert("RGB")
-            inputs = clip_processor(images=image, return_tensors="pt")
-            
-            with torch.no_grad():
-                features = clip_model.get_image_features(**inputs)
-                features = features / features.norm(dim=-1, keepdim=True)
-            
-            embedding = features[0].tolist()
-            
+            return load_image(img_path)
+        except Exception as e:
+            log.warning(f"  Failed to load {img_path.name}: {e}", indent=2)
+            return None
+    
+    def embed_batch(chunk):
+        # Decode the chunk on the decode pool; CLIP runs on the pipeline thread
+        images = list(decode_pool.map(load, chunk))
+        decoded = [(record, image) for record, image in zip(chunk, images) if image is not None]
+        if not decoded:
+            return [], len(chunk)
+        
+        try:
+            embeddings = embed_image_batch(clip_model, clip_processor, [image for _, image in decoded])
+            # Convert the whole batch in one call
+            embeddings = embeddings.tolist()
+        except Exception as e:
+            log.warning(f"  Failed to embed batch starting at {chunk[0][1][0].name}: {e}", indent=2)
+            return [], len(chunk)
+        
+        return [(record, embedding) for (record, _), embedding in zip(decoded, embeddings)], len(chunk) - len(decoded)
+    
+    def to_points(offset, chunk, result):
+        nonlocal failed
+        embedded, chunk_failed = result
+        failed += chunk_failed
+        
+        points = []
+        for (i, (img_path, category)), embedding in embedded:
             # Use top-level category (Fire_Disaster, not Urban_Fire)
             point = PointStruct(
                 id=i,
@@ -532,31 +843,26 @@ def seed_images(client, clip_model, clip_processor):
                 }
             )
             points.append(point)
-            
-        except Exception as e:
-            log.warning(f"  Failed to process {img_path.name}: {e}", indent=2)
-            failed += 1
-    
-    if not points:
-        log.warning("⚠️ No images were successfully processed")
-        return 0
+        return points
     
-    log.db(f"  Upserting {len(points)} images to Qdrant...", indent=1)
+    log.embed(f"  Embedding and upserting {len(images_to_process)} images (batch size {CLIP_BATCH_SIZE})...", indent=1)
     
     start = time.time()
-    client.upsert(collection_name="visual_evidence", points=points)
+    records = list(enumerate(images_to_process))
+    with ThreadPoolExecutor(max_workers=IMAGE_DECODE_WORKERS) as decode_pool:
+        count = await embed_and_upsert(aclient, "visual_evidence", records, embed_batch, to_points, CLIP_BATCH_SIZE)
     elapsed = time.time() - start
     
-    log.success(f"✅ Upserted {len(points)} images in {elapsed:.2f}s (failed: {failed})", indent=1)
+    if not count:
+        log.warning("⚠️ No images were successfully processed")
+        return 0
     
-    # Verify
-    info = client.get_collection("visual_evidence")
-    log.db(f"  Collection now has {info.points_count} points", indent=1)
+    log.success(f"✅ Upserted {count} images in {elapsed:.2f}s (failed: {failed})", indent=1)
     
-    return len(points)
+    return count
 
 
-def main():
+async def main():
     """Main seeding flow."""
     print("\n" + "=" * 60)
     print("  ResQ AI - Qdrant Seeding Script")
@@ -592,20 +898,23 @@ def main():
     
     # Step 5: Seed data
     log.info("Step 5: Seeding data to collections...")
+    aclient = create_async_client()
     
     total_points = 0
-    total_points += seed_incidents(client, text_model, sparse_model)
+    total_points += await seed_incidents(aclient, text_model, sparse_model)
     print()
     
-    total_points += seed_sops(client, text_model)
+    total_points += await seed_sops(aclient, text_model)
     print()
     
-    total_points += seed_landmarks(client, text_model, sparse_model)
+    total_points += await seed_landmarks(aclient, text_model, sparse_model)
     print()
     
-    total_points += seed_images(client, clip_model, clip_processor)
+    total_points += await seed_images(aclient, clip_model, clip_processor)
     print()
     
+    await aclient.close()
+    
     # Summary
     print("=" * 60)
     log.success(f"🎉 Seeding complete! Total points: {total_points}")
@@ -629,4 +938,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())